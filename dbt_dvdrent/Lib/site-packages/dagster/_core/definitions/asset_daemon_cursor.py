@@ -1,13 +1,27 @@
 import base64
+import dataclasses
 import datetime
+import functools
+import io
 import json
+import os
+import re
+import threading
 import zlib
+from dataclasses import dataclass
+from itertools import chain
 from typing import (
     AbstractSet,
+    Any,
+    Dict,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
+    Tuple,
+    Union,
 )
 
 import dagster._check as check
@@ -20,17 +34,245 @@ from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsSubset,
 )
 from dagster._serdes.serdes import deserialize_value, serialize_value, whitelist_for_serdes
+from dagster._utils import file_relative_path
 
 from .asset_graph import AssetGraph
 from .asset_subset import AssetSubset
 from .partition import PartitionsDefinition, PartitionsSubset
 
+try:
+    import orjson
 
-class AssetDaemonAssetCursor(NamedTuple):
+    def _json_dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Raw-content zstd dictionary holding the key names and serdes envelopes that every serialized
+# cursor repeats. Once cursors written with a given dictionary exist, its contents must never
+# change; add a new file and header byte instead.
+_CURSOR_ZSTD_DICT_PATH = file_relative_path(__file__, "asset_daemon_cursor.zstd_dict")
+
+# Single-byte headers prepended to zstd-compressed cursors. zlib-compressed cursors always start
+# with a zlib header byte (0x78), so the formats can be told apart.
+_ZSTD_CURSOR_HEADER = b"\x01"
+_ZSTD_DICT_V1_CURSOR_HEADER = b"\x02"
+
+# Prefix marking a b85-encoded compressed cursor. ":" is outside the b64 alphabet, so legacy
+# b64-encoded cursors never start with it.
+_B85_CURSOR_PREFIX = "b85:"
+
+_EVALUATION_ID_RE = re.compile(r'"evaluation_id"\s*:\s*(\d+)')
+
+# Number of characters of the serialized cursor that are encoded and fed to the compressor at a time
+_COMPRESSION_CHUNK_SIZE = 1 << 20
+
+if zstandard is not None:
+    with open(_CURSOR_ZSTD_DICT_PATH, "rb") as f:
+        _CURSOR_ZSTD_DICT = zstandard.ZstdCompressionDict(
+            f.read(), dict_type=zstandard.DICT_TYPE_RAWCONTENT
+        )
+
+# compressor / decompressor objects are much cheaper to reuse than to recreate, but can't be used
+# from multiple threads at once, so each thread gets its own
+_zstd_thread_local = threading.local()
+
+
+def _get_zstd_compressor() -> "zstandard.ZstdCompressor":
+    compressor = getattr(_zstd_thread_local, "compressor", None)
+    if compressor is None:
+        compressor = zstandard.ZstdCompressor(level=3, dict_data=_CURSOR_ZSTD_DICT)
+        _zstd_thread_local.compressor = compressor
+    return compressor
+
+
+def _get_zstd_decompressor(header: bytes) -> "zstandard.ZstdDecompressor":
+    decompressors_by_header = getattr(_zstd_thread_local, "decompressors_by_header", None)
+    if decompressors_by_header is None:
+        decompressors_by_header = {
+            _ZSTD_CURSOR_HEADER: zstandard.ZstdDecompressor(),
+            _ZSTD_DICT_V1_CURSOR_HEADER: zstandard.ZstdDecompressor(dict_data=_CURSOR_ZSTD_DICT),
+        }
+        _zstd_thread_local.decompressors_by_header = decompressors_by_header
+    return decompressors_by_header[header]
+
+
+def _should_compress_with_zstd() -> bool:
+    # zstandard isn't a dagster dependency, and a cursor written with it can't be read by any
+    # process that doesn't have it installed, so writing zstd cursors has to be opted into
+    if not os.getenv("DAGSTER_ASSET_DAEMON_ZSTD_CURSORS"):
+        return False
+    check.invariant(
+        zstandard is not None,
+        "DAGSTER_ASSET_DAEMON_ZSTD_CURSORS is set, but the zstandard package is not installed",
+    )
+    return True
+
+
+def _compress_serialized_cursor(serialized: str) -> bytes:
+    if not _should_compress_with_zstd():
+        return zlib.compress(serialized.encode("utf-8"))
+
+    # encode and compress the cursor a chunk at a time, so that the full utf-8 encoded payload is
+    # never held in memory alongside the string and its compressed form
+    out = io.BytesIO()
+    out.write(_ZSTD_DICT_V1_CURSOR_HEADER)
+    with _get_zstd_compressor().stream_writer(out, closefd=False) as writer:
+        for start in range(0, len(serialized), _COMPRESSION_CHUNK_SIZE):
+            writer.write(serialized[start : start + _COMPRESSION_CHUNK_SIZE].encode("utf-8"))
+    return out.getvalue()
+
+
+def _decompress_cursor_bytes(compressed_bytes: bytes) -> bytes:
+    header = compressed_bytes[:1]
+    if header not in (_ZSTD_CURSOR_HEADER, _ZSTD_DICT_V1_CURSOR_HEADER):
+        return zlib.decompress(compressed_bytes)
+    check.invariant(
+        zstandard is not None,
+        "Cursor was compressed with zstandard, but the zstandard package is not installed",
+    )
+    # streamed frames don't record their decompressed size, which decompress() requires. unlike
+    # decompress(), a decompressobj returns whatever it could decode from a truncated frame without
+    # raising, so check that it reached the end of the frame
+    decompressobj = _get_zstd_decompressor(header).decompressobj()
+    decompressed_bytes = decompressobj.decompress(compressed_bytes[1:])
+    check.invariant(decompressobj.eof, "Compressed cursor is truncated")
+    return decompressed_bytes
+
+
+def _loads_serialized_cursor(cursor: Union[str, bytes]) -> Any:
+    # JSON cursors start with "{" (or "[" for the backcompat list form), possibly after some
+    # whitespace, all of which are ascii, while a msgpack map always starts with a byte >= 0x80
+    if isinstance(cursor, bytes) and cursor[:1] >= b"\x80":
+        check.invariant(
+            msgpack is not None,
+            "Cursor was serialized with msgpack, but the msgpack package is not installed",
+        )
+        return msgpack.unpackb(cursor, raw=False)
+    return _json_loads(cursor)
+
+
+@functools.lru_cache(maxsize=8192)
+def _asset_key_path_from_user_string(asset_key_string: str) -> Tuple[str, ...]:
+    # the cursor is deserialized on every tick, and mostly contains the same keys from one tick to
+    # the next, so parsed keys are cached across calls
+    return tuple(AssetKey.from_user_string(asset_key_string).path)
+
+
+def _asset_key_from_user_string(asset_key_string: str) -> AssetKey:
+    # AssetKey.path is a mutable list, so every caller gets its own key rather than a cached
+    # instance. the path elements come from splitting a string, so AssetKey's parameter checks are
+    # skipped
+    return tuple.__new__(AssetKey, (list(_asset_key_path_from_user_string(asset_key_string)),))
+
+
+def _deserialize_handled_root_partitions_subset(
+    partitions_def: PartitionsDefinition, serialized_subset: str
+) -> PartitionsSubset:
+    try:
+        # in the case that the partitions def has changed, we may not be able to deserialize
+        # the corresponding subset. in this case, we just use an empty subset
+        subset = partitions_def.deserialize_subset(serialized_subset)
+        # this covers the case in which the start date has changed for a time-partitioned
+        # asset. in reality, we should be using the can_deserialize method but because we
+        # are not storing the serializable unique id, we can't do that.
+        if (
+            isinstance(subset, TimeWindowPartitionsSubset)
+            and isinstance(partitions_def, TimeWindowPartitionsDefinition)
+            and any(
+                time_window.start < partitions_def.start
+                for time_window in subset.included_time_windows
+            )
+        ):
+            subset = partitions_def.empty_subset()
+    except:
+        subset = partitions_def.empty_subset()
+    return subset
+
+
+class _LazyHandledRootPartitionsByAssetKey(Mapping[AssetKey, PartitionsSubset]):
+    """Mapping from a partitioned root asset key to its handled partitions subset, which only
+    deserializes each subset the first time it is accessed. The daemon's ticks read every subset,
+    but callers that only need the rest of the cursor, e.g. its evaluation id, never pay for them.
+    """
+
+    def __init__(
+        self,
+        serialized_subsets_by_asset_key: Mapping[AssetKey, Tuple[PartitionsDefinition, str]],
+    ):
+        self._serialized_subsets_by_asset_key = serialized_subsets_by_asset_key
+        self._subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+
+    def __getitem__(self, asset_key: AssetKey) -> PartitionsSubset:
+        # subsets are parsed one at a time as they are read, rather than in bulk on a thread pool:
+        # parsing is pure Python and holds the GIL, so a pool would add overhead without using more
+        # than one core
+        subset = self._subsets_by_asset_key.get(asset_key)
+        if subset is None:
+            partitions_def, serialized_subset = self._serialized_subsets_by_asset_key[asset_key]
+            subset = _deserialize_handled_root_partitions_subset(partitions_def, serialized_subset)
+            self._subsets_by_asset_key[asset_key] = subset
+        return subset
+
+    def __contains__(self, asset_key: object) -> bool:
+        return asset_key in self._serialized_subsets_by_asset_key
+
+    def __iter__(self) -> Iterator[AssetKey]:
+        return iter(self._serialized_subsets_by_asset_key)
+
+    def __len__(self) -> int:
+        return len(self._serialized_subsets_by_asset_key)
+
+    def __repr__(self) -> str:
+        # list the keys only, since rendering the subsets would deserialize all of them
+        return f"{type(self).__name__}({list(self._serialized_subsets_by_asset_key)!r})"
+
+
+class _FrozenSlotsState:
+    """Supplies the __getstate__ / __setstate__ that dataclass(slots=True) would generate. Without
+    them, copying or unpickling a frozen dataclass with __slots__ fails, because the default
+    implementation restores each slot through the frozen __setattr__.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+# dataclass(slots=True) requires python 3.10, so __slots__ are declared explicitly on the cursor
+# classes below. this is only possible because none of their fields have default values
+@dataclass(frozen=True)
+class AssetDaemonAssetCursor(_FrozenSlotsState):
     """Convenience class to represent the state of an individual asset being handled by the daemon.
     In the future, this will be serialized as part of the cursor.
     """
 
+    __slots__ = (
+        "asset_key",
+        "latest_storage_id",
+        "latest_evaluation_timestamp",
+        "latest_evaluation",
+        "materialized_requested_or_discarded_subset",
+    )
+
     asset_key: AssetKey
     latest_storage_id: Optional[int]
     latest_evaluation_timestamp: Optional[float]
@@ -56,13 +298,15 @@ class AssetDaemonAssetCursor(NamedTuple):
             asset_graph.get_partitions_def(self.asset_key),
             newly_materialized_requested_or_discarded_asset_partitions,
         )
-        return self._replace(
+        return dataclasses.replace(
+            self,
             materialized_requested_or_discarded_subset=self.materialized_requested_or_discarded_subset
-            | newly_materialized_requested_or_discarded_subset
+            | newly_materialized_requested_or_discarded_subset,
         )
 
 
-class AssetDaemonCursor(NamedTuple):
+@dataclass(frozen=True)
+class AssetDaemonCursor(_FrozenSlotsState):
     """State that's saved between reconciliation evaluations.
 
     Attributes:
@@ -81,6 +325,16 @@ class AssetDaemonCursor(NamedTuple):
             timestamp of the tick that requested the observation.
     """
 
+    __slots__ = (
+        "latest_storage_id",
+        "handled_root_asset_keys",
+        "handled_root_partitions_by_asset_key",
+        "evaluation_id",
+        "last_observe_request_timestamp_by_asset_key",
+        "latest_evaluation_by_asset_key",
+        "latest_evaluation_timestamp",
+    )
+
     latest_storage_id: Optional[int]
     handled_root_asset_keys: AbstractSet[AssetKey]
     handled_root_partitions_by_asset_key: Mapping[AssetKey, PartitionsSubset]
@@ -123,13 +377,12 @@ class AssetDaemonCursor(NamedTuple):
         """Returns a cursor that represents this cursor plus the updates that have happened within the
         tick.
         """
-        result_last_observe_request_timestamp_by_asset_key = {
-            **self.last_observe_request_timestamp_by_asset_key
-        }
-        for asset_key in newly_observe_requested_asset_keys:
-            result_last_observe_request_timestamp_by_asset_key[
-                asset_key
-            ] = observe_request_timestamp
+        result_last_observe_request_timestamp_by_asset_key = dict(
+            self.last_observe_request_timestamp_by_asset_key
+        )
+        result_last_observe_request_timestamp_by_asset_key.update(
+            dict.fromkeys(newly_observe_requested_asset_keys, observe_request_timestamp)
+        )
 
         if latest_storage_id and self.latest_storage_id:
             check.invariant(
@@ -144,19 +397,20 @@ class AssetDaemonCursor(NamedTuple):
             if not evaluation.is_empty
         }
 
+        # classify each asset cursor in a single pass
+        handled_root_asset_keys: Set[AssetKey] = set()
+        handled_root_partitions_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+        for cursor in asset_cursors:
+            subset = cursor.materialized_requested_or_discarded_subset
+            if subset.is_partitioned:
+                handled_root_partitions_by_asset_key[cursor.asset_key] = subset.subset_value
+            elif subset.bool_value:
+                handled_root_asset_keys.add(cursor.asset_key)
+
         return AssetDaemonCursor(
             latest_storage_id=latest_storage_id or self.latest_storage_id,
-            handled_root_asset_keys={
-                cursor.asset_key
-                for cursor in asset_cursors
-                if not cursor.materialized_requested_or_discarded_subset.is_partitioned
-                and cursor.materialized_requested_or_discarded_subset.bool_value
-            },
-            handled_root_partitions_by_asset_key={
-                cursor.asset_key: cursor.materialized_requested_or_discarded_subset.subset_value
-                for cursor in asset_cursors
-                if cursor.materialized_requested_or_discarded_subset.is_partitioned
-            },
+            handled_root_asset_keys=frozenset(handled_root_asset_keys),
+            handled_root_partitions_by_asset_key=handled_root_partitions_by_asset_key,
             evaluation_id=evaluation_id,
             last_observe_request_timestamp_by_asset_key=result_last_observe_request_timestamp_by_asset_key,
             latest_evaluation_by_asset_key=latest_evaluation_by_asset_key,
@@ -168,7 +422,7 @@ class AssetDaemonCursor(NamedTuple):
         return AssetDaemonCursor(
             latest_storage_id=None,
             handled_root_partitions_by_asset_key={},
-            handled_root_asset_keys=set(),
+            handled_root_asset_keys=frozenset(),
             evaluation_id=0,
             last_observe_request_timestamp_by_asset_key={},
             latest_evaluation_by_asset_key={},
@@ -176,8 +430,11 @@ class AssetDaemonCursor(NamedTuple):
         )
 
     @classmethod
-    def from_serialized(cls, cursor: str, asset_graph: AssetGraph) -> "AssetDaemonCursor":
-        data = json.loads(cursor)
+    def from_serialized(
+        cls, cursor: Union[str, bytes], asset_graph: AssetGraph
+    ) -> "AssetDaemonCursor":
+        """Deserializes a cursor produced by either serialize (JSON) or serialize_v2 (msgpack)."""
+        data = _loads_serialized_cursor(cursor)
 
         if isinstance(data, list):  # backcompat
             check.invariant(len(data) in [3, 4], "Invalid serialized cursor")
@@ -206,12 +463,14 @@ class AssetDaemonCursor(NamedTuple):
             )
             latest_evaluation_timestamp = data.get("latest_evaluation_timestamp", 0)
 
-        handled_root_partitions_by_asset_key = {}
+        # bind module-level helpers to locals for the loops below
+        asset_key_from_user_string = _asset_key_from_user_string
+        serialized_handled_root_partitions = {}
         for (
             key_str,
             serialized_subset,
         ) in serialized_handled_root_partitions_by_asset_key.items():
-            key = AssetKey.from_user_string(key_str)
+            key = asset_key_from_user_string(key_str)
             if key not in asset_graph.materializable_asset_keys:
                 continue
 
@@ -219,29 +478,14 @@ class AssetDaemonCursor(NamedTuple):
             if partitions_def is None:
                 continue
 
-            try:
-                # in the case that the partitions def has changed, we may not be able to deserialize
-                # the corresponding subset. in this case, we just use an empty subset
-                subset = partitions_def.deserialize_subset(serialized_subset)
-                # this covers the case in which the start date has changed for a time-partitioned
-                # asset. in reality, we should be using the can_deserialize method but because we
-                # are not storing the serializable unique id, we can't do that.
-                if (
-                    isinstance(subset, TimeWindowPartitionsSubset)
-                    and isinstance(partitions_def, TimeWindowPartitionsDefinition)
-                    and any(
-                        time_window.start < partitions_def.start
-                        for time_window in subset.included_time_windows
-                    )
-                ):
-                    subset = partitions_def.empty_subset()
-            except:
-                subset = partitions_def.empty_subset()
-            handled_root_partitions_by_asset_key[key] = subset
+            serialized_handled_root_partitions[key] = (partitions_def, serialized_subset)
+        handled_root_partitions_by_asset_key = _LazyHandledRootPartitionsByAssetKey(
+            serialized_handled_root_partitions
+        )
 
         latest_evaluation_by_asset_key = {}
         for key_str, serialized_evaluation in serialized_latest_evaluation_by_asset_key.items():
-            key = AssetKey.from_user_string(key_str)
+            key = asset_key_from_user_string(key_str)
             evaluation = check.inst(
                 deserialize_value(serialized_evaluation), AutoMaterializeAssetEvaluation
             )
@@ -249,13 +493,14 @@ class AssetDaemonCursor(NamedTuple):
 
         return cls(
             latest_storage_id=latest_storage_id,
-            handled_root_asset_keys={
-                AssetKey.from_user_string(key_str) for key_str in serialized_handled_root_asset_keys
-            },
+            handled_root_asset_keys=frozenset(
+                asset_key_from_user_string(key_str)
+                for key_str in serialized_handled_root_asset_keys
+            ),
             handled_root_partitions_by_asset_key=handled_root_partitions_by_asset_key,
             evaluation_id=evaluation_id,
             last_observe_request_timestamp_by_asset_key={
-                AssetKey.from_user_string(key_str): timestamp
+                asset_key_from_user_string(key_str): timestamp
                 for key_str, timestamp in serialized_last_observe_request_timestamp_by_asset_key.items()
             },
             latest_evaluation_by_asset_key=latest_evaluation_by_asset_key,
@@ -263,41 +508,69 @@ class AssetDaemonCursor(NamedTuple):
         )
 
     @classmethod
-    def get_evaluation_id_from_serialized(cls, cursor: str) -> Optional[int]:
-        data = json.loads(cursor)
+    def get_evaluation_id_from_serialized(cls, cursor: Union[str, bytes]) -> Optional[int]:
+        if isinstance(cursor, str):
+            # avoid parsing the entire cursor just to read a single top-level integer. the key can
+            # also appear unescaped inside the per-asset mappings (e.g. for an asset named
+            # "evaluation_id"), so only trust the match when it is the only one
+            match = _EVALUATION_ID_RE.search(cursor)
+            if match and not _EVALUATION_ID_RE.search(cursor, match.end()):
+                return int(match.group(1))
+
+        data = _loads_serialized_cursor(cursor)
         if isinstance(data, list):  # backcompat
             check.invariant(len(data) in [3, 4], "Invalid serialized cursor")
             return data[3] if len(data) == 4 else None
         else:
             return data["evaluation_id"]
 
-    def serialize(self) -> str:
+    def _to_serializable_dict(self) -> Mapping[str, Any]:
+        # bind functions used in the comprehensions below to locals
+        to_user_string = AssetKey.to_user_string
+        serialize_evaluation = serialize_value
+        # keys frequently appear in more than one of the mappings below, so convert each one once
+        user_string_by_key = {
+            key: to_user_string(key)
+            for key in chain(
+                self.handled_root_asset_keys,
+                self.handled_root_partitions_by_asset_key,
+                self.last_observe_request_timestamp_by_asset_key,
+                self.latest_evaluation_by_asset_key,
+            )
+        }
         serializable_handled_root_partitions_by_asset_key = {
-            key.to_user_string(): subset.serialize()
+            user_string_by_key[key]: subset.serialize()
             for key, subset in self.handled_root_partitions_by_asset_key.items()
         }
-        serialized = json.dumps(
-            {
-                "latest_storage_id": self.latest_storage_id,
-                "handled_root_asset_keys": [
-                    key.to_user_string() for key in self.handled_root_asset_keys
-                ],
-                "handled_root_partitions_by_asset_key": (
-                    serializable_handled_root_partitions_by_asset_key
-                ),
-                "evaluation_id": self.evaluation_id,
-                "last_observe_request_timestamp_by_asset_key": {
-                    key.to_user_string(): timestamp
-                    for key, timestamp in self.last_observe_request_timestamp_by_asset_key.items()
-                },
-                "latest_evaluation_by_asset_key": {
-                    key.to_user_string(): serialize_value(evaluation)
-                    for key, evaluation in self.latest_evaluation_by_asset_key.items()
-                },
-                "latest_evaluation_timestamp": self.latest_evaluation_timestamp,
-            }
-        )
-        return serialized
+        return {
+            "latest_storage_id": self.latest_storage_id,
+            "handled_root_asset_keys": [
+                user_string_by_key[key] for key in self.handled_root_asset_keys
+            ],
+            "handled_root_partitions_by_asset_key": (
+                serializable_handled_root_partitions_by_asset_key
+            ),
+            "evaluation_id": self.evaluation_id,
+            "last_observe_request_timestamp_by_asset_key": {
+                user_string_by_key[key]: timestamp
+                for key, timestamp in self.last_observe_request_timestamp_by_asset_key.items()
+            },
+            "latest_evaluation_by_asset_key": {
+                user_string_by_key[key]: serialize_evaluation(evaluation)
+                for key, evaluation in self.latest_evaluation_by_asset_key.items()
+            },
+            "latest_evaluation_timestamp": self.latest_evaluation_timestamp,
+        }
+
+    def serialize(self) -> str:
+        return _json_dumps(self._to_serializable_dict())
+
+    def serialize_v2(self) -> bytes:
+        """Serializes the cursor to msgpack, which is more compact and faster to decode than the
+        JSON produced by serialize. The result can be passed to from_serialized.
+        """
+        check.invariant(msgpack is not None, "serialize_v2 requires the msgpack package")
+        return msgpack.packb(self._to_serializable_dict(), use_bin_type=True)
 
 
 @whitelist_for_serdes
@@ -311,19 +584,33 @@ class LegacyAssetDaemonCursorWrapper(NamedTuple):
 
     @staticmethod
     def from_compressed(compressed: str) -> "LegacyAssetDaemonCursorWrapper":
-        """This method takes a b64 encoded, zlib compressed string and returns the original
+        """This method takes a b85 (or legacy b64) encoded, compressed string and returns the
+        original BackcompatAssetDaemonEvaluationInfo object.
+        """
+        if compressed.startswith(_B85_CURSOR_PREFIX):
+            decoded_bytes = base64.b85decode(compressed[len(_B85_CURSOR_PREFIX) :])
+        else:
+            decoded_bytes = base64.b64decode(compressed)
+        return LegacyAssetDaemonCursorWrapper.from_compressed_bytes(decoded_bytes)
+
+    @staticmethod
+    def from_compressed_bytes(compressed_bytes: bytes) -> "LegacyAssetDaemonCursorWrapper":
+        """This method takes zlib (or zstandard) compressed bytes and returns the original
         BackcompatAssetDaemonEvaluationInfo object.
         """
-        decoded_bytes = base64.b64decode(compressed)
-        decompressed_bytes = zlib.decompress(decoded_bytes)
+        decompressed_bytes = _decompress_cursor_bytes(compressed_bytes)
         decoded_str = decompressed_bytes.decode("utf-8")
         return deserialize_value(decoded_str, LegacyAssetDaemonCursorWrapper)
 
     def to_compressed(self) -> str:
-        """This method compresses the serialized cursor and returns a b64 encoded string to be
+        """This method compresses the serialized cursor and returns a b85 encoded string to be
         stored as a string value.
         """
-        serialized_bytes = serialize_value(self).encode("utf-8")
-        compressed_bytes = zlib.compress(serialized_bytes)
-        encoded_str = base64.b64encode(compressed_bytes)
-        return encoded_str.decode("utf-8")
+        encoded_str = base64.b85encode(self.to_compressed_bytes())
+        return _B85_CURSOR_PREFIX + encoded_str.decode("utf-8")
+
+    def to_compressed_bytes(self) -> bytes:
+        """This method compresses the serialized cursor and returns the raw compressed bytes, for
+        storage that can hold binary values directly.
+        """
+        return _compress_serialized_cursor(serialize_value(self))
@@ -135,9 +135,13 @@ class AutoMaterializeAssetEvaluation(NamedTuple):
 
     @property
     def is_empty(self) -> bool:
+        # counts are never negative, so checking each one short-circuits on the common non-empty
+        # case without building an intermediate list
         return (
-            sum([self.num_requested, self.num_skipped, self.num_discarded]) == 0
-            and len(self.partition_subsets_by_condition) == 0
+            not self.num_requested
+            and not self.num_skipped
+            and not self.num_discarded
+            and not self.partition_subsets_by_condition
         )
 
     @staticmethod
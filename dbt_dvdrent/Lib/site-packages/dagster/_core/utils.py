@@ -1,3 +1,4 @@
+import functools
 import os
 import random
 import string
@@ -50,7 +51,12 @@ def coerce_valid_log_level(log_level: Union[str, int]) -> int:
     """Convert a log level into an integer for consumption by the low-level Python logging API."""
     if isinstance(log_level, int):
         return log_level
-    str_log_level = check.str_param(log_level, "log_level")
+    return _coerce_valid_str_log_level(check.str_param(log_level, "log_level"))
+
+
+# Log levels come from a small, fixed set of names, so the result of parsing each one is cached
+@functools.lru_cache(maxsize=64)
+def _coerce_valid_str_log_level(str_log_level: str) -> int:
     check.invariant(
         str_log_level.lower() in PYTHON_LOGGING_LEVELS_NAMES,
         "Bad value for log level {level}: permissible values are {levels}.".format(
@@ -60,8 +66,10 @@ def coerce_valid_log_level(log_level: Union[str, int]) -> int:
             ),
         ),
     )
-    str_log_level = PYTHON_LOGGING_LEVELS_ALIASES.get(log_level.upper(), log_level.upper())
-    return PYTHON_LOGGING_LEVELS_MAPPING[str_log_level]
+    upper_log_level = str_log_level.upper()
+    return PYTHON_LOGGING_LEVELS_MAPPING[
+        PYTHON_LOGGING_LEVELS_ALIASES.get(upper_log_level, upper_log_level)
+    ]
 
 
 def toposort(data: Mapping[T, AbstractSet[T]]) -> Sequence[Sequence[T]]:
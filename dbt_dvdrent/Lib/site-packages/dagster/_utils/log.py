@@ -1,5 +1,5 @@
-import copy
 import logging
+import logging.handlers
 import sys
 import traceback
 from typing import Mapping, NamedTuple, Optional
@@ -13,15 +13,80 @@ from dagster._annotations import deprecated
 from dagster._core.definitions.logger_definition import logger
 from dagster._core.utils import coerce_valid_log_level
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_default(value: object) -> object:
+    # the stdlib encoder writes tuples (including NamedTuples such as AssetKey and DagsterEvent) as
+    # lists, which orjson only does for exact tuples. anything else it can't encode is rejected, so
+    # that the record falls back to the stdlib encoder and is written exactly as it was before
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError
+
+
+def _dumps_log_dict(log_dict: Mapping[str, object]) -> str:
+    """Encodes a log record dict with orjson when possible, producing JSON that decodes to the same
+    value as the stdlib encoder's output, except that NaN and Infinity are written as null. Records
+    orjson can't encode the same way are encoded with the stdlib encoder instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                log_dict,
+                default=_orjson_default,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SORT_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        # raised for values passed to _orjson_default that aren't tuples, as well as for values
+        # orjson rejects outright, e.g. integers wider than 64 bits
+        except orjson.JSONEncodeError:
+            pass
+    return seven.json.dumps(log_dict)
+
+
+class _JsonLinesFileHandler(logging.handlers.WatchedFileHandler):
+    """Base class for handlers that append one JSON document per line to a file. The file is kept
+    open between records rather than being reopened for every record, and each line is flushed as
+    soon as it is written, so readers of the file see every record immediately. As with
+    WatchedFileHandler, the file is reopened if it has been moved or deleted, e.g. by log rotation.
+
+    On Windows, a file that is held open can't be moved or deleted, so the file is instead opened
+    and closed for every record there.
+    """
 
-class JsonFileHandler(logging.Handler):
     def __init__(self, json_path: str):
-        super(JsonFileHandler, self).__init__()
         self.json_path = check.str_param(json_path, "json_path")
+        super(_JsonLinesFileHandler, self).__init__(json_path, encoding="utf8", delay=True)
+
+    def _write_line(self, text_line: str) -> None:
+        # called from emit, which logging.Handler.handle already serializes with the handler lock
+        if seven.IS_WINDOWS:
+            with open(self.json_path, "a", encoding="utf8") as f:
+                f.write(text_line + "\n")
+            return
+
+        if self.stream is None:
+            self.stream = self._open()
+            self._statstream()
+        else:
+            self.reopenIfNeeded()
+        self.stream.write(text_line + "\n")
+        self.stream.flush()
+
+
+class JsonFileHandler(_JsonLinesFileHandler):
+    def __init__(self, json_path: str):
+        super(JsonFileHandler, self).__init__(json_path)
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            log_dict = copy.copy(record.__dict__)
+            log_dict = record.__dict__.copy()
 
             # This horrific monstrosity is to maintain backwards compatability
             # with the old behavior of the JsonFileHandler, which the clarify
@@ -38,9 +103,7 @@ class JsonFileHandler(logging.Handler):
 
             log_dict.update(dagster_meta_dict)
 
-            with open(self.json_path, "a", encoding="utf8") as ff:
-                text_line = seven.json.dumps(log_dict)
-                ff.write(text_line + "\n")
+            self._write_line(_dumps_log_dict(log_dict))
         # Need to catch Exception here, so disabling lint
         except Exception as e:
             logging.critical("[%s] Error during logging!", self.__class__.__name__)
@@ -76,19 +139,30 @@ class StructuredLoggerMessage(
             check.inst_param(record, "record", logging.LogRecord),
         )
 
+    @classmethod
+    def _make_fast(
+        cls,
+        name: str,
+        message: str,
+        level: int,
+        meta: Mapping[object, object],
+        record: logging.LogRecord,
+    ) -> "StructuredLoggerMessage":
+        """Skips the parameter checks in __new__, for use on the logging hot path where the fields
+        come straight from a LogRecord.
+        """
+        return tuple.__new__(cls, (name, message, coerce_valid_log_level(level), meta, record))
+
 
-class JsonEventLoggerHandler(logging.Handler):
+class JsonEventLoggerHandler(_JsonLinesFileHandler):
     def __init__(self, json_path: str, construct_event_record):
-        super(JsonEventLoggerHandler, self).__init__()
-        self.json_path = check.str_param(json_path, "json_path")
+        super(JsonEventLoggerHandler, self).__init__(json_path)
         self.construct_event_record = construct_event_record
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
             event_record = self.construct_event_record(record)
-            with open(self.json_path, "a", encoding="utf8") as ff:
-                text_line = seven.json.dumps(event_record.to_dict())
-                ff.write(text_line + "\n")
+            self._write_line(seven.json.dumps(event_record.to_dict()))
 
         # Need to catch Exception here, so disabling lint
         except Exception as e:
@@ -104,7 +178,7 @@ class StructuredLoggerHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         try:
             self.callback(
-                StructuredLoggerMessage(
+                StructuredLoggerMessage._make_fast(  # noqa: SLF001
                     name=record.name,
                     message=record.msg,
                     level=record.levelno,
@@ -215,17 +289,18 @@ def define_default_formatter():
     return logging.Formatter(default_format_string(), default_date_format_string())
 
 
-def get_structlog_shared_processors():
-    timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
+_STRUCTLOG_SHARED_PROCESSORS = (
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+    structlog.processors.StackInfoRenderer(),
+)
 
-    shared_processors = [
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        timestamper,
-        structlog.processors.StackInfoRenderer(),
-    ]
 
-    return shared_processors
+def get_structlog_shared_processors():
+    # the processors are stateless, so they are built once and shared. return a fresh list so
+    # callers remain free to modify it
+    return list(_STRUCTLOG_SHARED_PROCESSORS)
 
 
 def get_structlog_json_formatter() -> structlog.stdlib.ProcessorFormatter:
@@ -310,15 +385,34 @@ def configure_loggers(handler="default", formatter="colored", log_level="INFO"):
     logging.config.dictConfig(LOGGING_CONFIG)
 
 
+# Formatters hold no per-logger state, so they are built once and shared by every console logger
+# rather than being rebuilt by coloredlogs.install on each call.
+_COLORED_CONSOLE_FORMATTER = coloredlogs.ColoredFormatter(
+    fmt=default_format_string(),
+    datefmt=default_date_format_string(),
+    field_styles={"levelname": {"color": "blue"}, "asctime": {"color": "green"}},
+    level_styles={"debug": {}, "error": {"color": "red"}},
+)
+_BASIC_CONSOLE_FORMATTER = coloredlogs.BasicFormatter(
+    fmt=default_format_string(),
+    datefmt=default_date_format_string(),
+)
+
+
+def _console_supports_colors() -> bool:
+    # same terminal detection that coloredlogs.install performs
+    if coloredlogs.on_windows() and not coloredlogs.enable_ansi_support():
+        return False
+    return coloredlogs.terminal_supports_colors()
+
+
 def create_console_logger(name, level):
     klass = logging.getLoggerClass()
-    handler = klass(name, level=level)
-    coloredlogs.install(
-        logger=handler,
-        level=level,
-        fmt=default_format_string(),
-        datefmt=default_date_format_string(),
-        field_styles={"levelname": {"color": "blue"}, "asctime": {"color": "green"}},
-        level_styles={"debug": {}, "error": {"color": "red"}},
+    logger_ = klass(name, level=level)
+    handler = coloredlogs.StandardErrorHandler()
+    handler.setLevel(level)
+    handler.setFormatter(
+        _COLORED_CONSOLE_FORMATTER if _console_supports_colors() else _BASIC_CONSOLE_FORMATTER
     )
-    return handler
+    logger_.addHandler(handler)
+    return logger_
@@ -0,0 +1,267 @@
+import copy
+import dataclasses
+import json
+import pickle
+import zlib
+
+import dagster._core.definitions.asset_daemon_cursor as asset_daemon_cursor_module
+import pytest
+from dagster import AssetKey, DailyPartitionsDefinition, StaticPartitionsDefinition, asset
+from dagster._check import CheckError
+from dagster._core.definitions.asset_daemon_cursor import (
+    AssetDaemonAssetCursor,
+    AssetDaemonCursor,
+    LegacyAssetDaemonCursorWrapper,
+    _LazyHandledRootPartitionsByAssetKey,
+)
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.asset_subset import AssetSubset
+from dagster._serdes.serdes import serialize_value
+
+
+def _populated_cursor() -> AssetDaemonCursor:
+    return AssetDaemonCursor(
+        latest_storage_id=5,
+        handled_root_asset_keys=frozenset({AssetKey("a"), AssetKey(["b", "c"])}),
+        handled_root_partitions_by_asset_key={},
+        evaluation_id=12,
+        last_observe_request_timestamp_by_asset_key={AssetKey("source"): 1700000000.5},
+        latest_evaluation_by_asset_key={},
+        latest_evaluation_timestamp=1700000001.0,
+    )
+
+
+@pytest.mark.parametrize(
+    "roundtrip",
+    [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_cursor_copy_and_pickle_roundtrip(roundtrip):
+    for cursor in [AssetDaemonCursor.empty(), _populated_cursor()]:
+        assert roundtrip(cursor) == cursor
+
+    asset_cursor = AssetDaemonAssetCursor(
+        asset_key=AssetKey("a"),
+        latest_storage_id=5,
+        latest_evaluation_timestamp=None,
+        latest_evaluation=None,
+        materialized_requested_or_discarded_subset=AssetSubset(asset_key=AssetKey("a"), value=True),
+    )
+    assert roundtrip(asset_cursor) == asset_cursor
+
+
+def test_get_evaluation_id_with_asset_named_evaluation_id():
+    cursor = AssetDaemonCursor(
+        latest_storage_id=5,
+        handled_root_asset_keys=frozenset(),
+        handled_root_partitions_by_asset_key={},
+        evaluation_id=12,
+        last_observe_request_timestamp_by_asset_key={AssetKey("evaluation_id"): 1700000000.5},
+        latest_evaluation_by_asset_key={},
+        latest_evaluation_timestamp=1700000001.0,
+    )
+    serialized = cursor.serialize()
+    assert AssetDaemonCursor.get_evaluation_id_from_serialized(serialized) == 12
+
+    # the result must not depend on the order the top-level keys are written in
+    reordered = json.dumps(dict(reversed(list(json.loads(serialized).items()))))
+    assert AssetDaemonCursor.get_evaluation_id_from_serialized(reordered) == 12
+
+
+_static_partitions_def = StaticPartitionsDefinition(["x", "y", "z"])
+
+
+@asset(partitions_def=_static_partitions_def)
+def static_root(): ...
+
+
+@pytest.fixture
+def deserialize_calls(monkeypatch):
+    calls = []
+    deserialize = asset_daemon_cursor_module._deserialize_handled_root_partitions_subset
+
+    def _counting_deserialize(partitions_def, serialized_subset):
+        calls.append(serialized_subset)
+        return deserialize(partitions_def, serialized_subset)
+
+    monkeypatch.setattr(
+        asset_daemon_cursor_module,
+        "_deserialize_handled_root_partitions_subset",
+        _counting_deserialize,
+    )
+    return calls
+
+
+def test_lazy_handled_root_partitions_deserializes_on_first_read(deserialize_calls):
+    subset = _static_partitions_def.subset_with_partition_keys(["x", "z"])
+    lazy_subsets = _LazyHandledRootPartitionsByAssetKey(
+        {AssetKey("static_root"): (_static_partitions_def, subset.serialize())}
+    )
+    assert AssetKey("static_root") in lazy_subsets
+    assert list(lazy_subsets) == [AssetKey("static_root")]
+    assert len(lazy_subsets) == 1
+    assert repr(lazy_subsets) == (
+        f"_LazyHandledRootPartitionsByAssetKey([{AssetKey('static_root')!r}])"
+    )
+    assert deserialize_calls == []
+
+    first_read = lazy_subsets[AssetKey("static_root")]
+    assert first_read == subset
+    assert lazy_subsets[AssetKey("static_root")] is first_read
+    assert lazy_subsets == {AssetKey("static_root"): subset}
+    assert deserialize_calls == [subset.serialize()]
+
+
+def test_lazy_handled_root_partitions_falls_back_to_empty_subset():
+    old_daily_partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+    new_daily_partitions_def = DailyPartitionsDefinition(start_date="2023-02-01")
+    old_daily_subset = old_daily_partitions_def.subset_with_partition_keys(["2023-01-05"])
+    lazy_subsets = _LazyHandledRootPartitionsByAssetKey(
+        {
+            AssetKey("bad_subset"): (_static_partitions_def, "not a serialized subset"),
+            AssetKey("start_date_changed"): (
+                new_daily_partitions_def,
+                old_daily_subset.serialize(),
+            ),
+        }
+    )
+    assert lazy_subsets == {
+        AssetKey("bad_subset"): _static_partitions_def.empty_subset(),
+        AssetKey("start_date_changed"): new_daily_partitions_def.empty_subset(),
+    }
+
+
+def test_from_serialized_handled_root_partitions_are_lazy(deserialize_calls):
+    subset = _static_partitions_def.subset_with_partition_keys(["y"])
+    cursor = dataclasses.replace(
+        _populated_cursor(), handled_root_partitions_by_asset_key={AssetKey("static_root"): subset}
+    )
+
+    deserialized = AssetDaemonCursor.from_serialized(
+        cursor.serialize(), AssetGraph.from_assets([static_root])
+    )
+    assert deserialized.evaluation_id == 12
+    assert deserialize_calls == []
+
+    assert deserialized == cursor
+    assert deserialize_calls == [subset.serialize()]
+
+
+def _legacy_cursor_wrapper() -> LegacyAssetDaemonCursorWrapper:
+    return LegacyAssetDaemonCursorWrapper(serialized_cursor=_populated_cursor().serialize())
+
+
+def test_compressed_cursor_uses_zlib_by_default(monkeypatch):
+    monkeypatch.delenv("DAGSTER_ASSET_DAEMON_ZSTD_CURSORS", raising=False)
+    wrapper = _legacy_cursor_wrapper()
+
+    compressed_bytes = wrapper.to_compressed_bytes()
+    assert zlib.decompress(compressed_bytes).decode("utf-8") == serialize_value(wrapper)
+    assert LegacyAssetDaemonCursorWrapper.from_compressed_bytes(compressed_bytes) == wrapper
+
+
+def test_zstd_compressed_cursor_roundtrip(monkeypatch):
+    zstandard = pytest.importorskip("zstandard")
+    monkeypatch.setenv("DAGSTER_ASSET_DAEMON_ZSTD_CURSORS", "1")
+    wrapper = _legacy_cursor_wrapper()
+
+    compressed_bytes = wrapper.to_compressed_bytes()
+    assert compressed_bytes[:1] == b"\x02"
+    assert LegacyAssetDaemonCursorWrapper.from_compressed_bytes(compressed_bytes) == wrapper
+    assert LegacyAssetDaemonCursorWrapper.from_compressed(wrapper.to_compressed()) == wrapper
+
+    # cursors compressed without the dictionary are still readable
+    no_dict_bytes = b"\x01" + zstandard.ZstdCompressor().compress(
+        serialize_value(wrapper).encode("utf-8")
+    )
+    assert LegacyAssetDaemonCursorWrapper.from_compressed_bytes(no_dict_bytes) == wrapper
+
+
+def test_zstd_compressed_cursor_requires_zstandard(monkeypatch):
+    monkeypatch.setenv("DAGSTER_ASSET_DAEMON_ZSTD_CURSORS", "1")
+    monkeypatch.setattr(asset_daemon_cursor_module, "zstandard", None)
+    with pytest.raises(CheckError, match="zstandard package is not installed"):
+        _legacy_cursor_wrapper().to_compressed_bytes()
+
+
+# written by the base64 / zlib implementation of LegacyAssetDaemonCursorWrapper.to_compressed, for
+# a cursor with evaluation_id 12 and "a" as its only handled root asset key
+_LEGACY_COMPRESSED_CURSOR = (
+    "eJyNj0GLwkAMhf9KydmLC168iXvc+x52lhDboIPTTk1SoZb+dyeLqCALngJ533t5mQCxTqSKCOsKvnhP9bhRZfskbnO3"
+    "HUSzfAv1PQssKlCWSCleuMH6T3PbFCCRsRqqZaE9Y2xCEVaLKsCBuiYVXHI2JI/GI4/q+k8ACvD7QvUkFi3mTnE3PjxumWan"
+    "+UxpICdul5Yfvi6PGOZd6XhmFD4NXsliWwa1/T9Zt+ZPke9y92SHuiGlGeYr6Tt8FQ=="
+)
+
+
+def test_from_compressed_reads_legacy_b64_cursor():
+    wrapper = LegacyAssetDaemonCursorWrapper.from_compressed(_LEGACY_COMPRESSED_CURSOR)
+    assert json.loads(wrapper.serialized_cursor)["handled_root_asset_keys"] == ["a"]
+    assert AssetDaemonCursor.get_evaluation_id_from_serialized(wrapper.serialized_cursor) == 12
+
+
+@pytest.mark.parametrize("use_zstd", [False, True], ids=["zlib", "zstd"])
+def test_compressed_cursor_roundtrip(monkeypatch, use_zstd):
+    if use_zstd:
+        pytest.importorskip("zstandard")
+        monkeypatch.setenv("DAGSTER_ASSET_DAEMON_ZSTD_CURSORS", "1")
+    else:
+        monkeypatch.delenv("DAGSTER_ASSET_DAEMON_ZSTD_CURSORS", raising=False)
+    wrapper = _legacy_cursor_wrapper()
+
+    compressed = wrapper.to_compressed()
+    assert compressed.startswith("b85:")
+    assert LegacyAssetDaemonCursorWrapper.from_compressed(compressed) == wrapper
+
+    compressed_bytes = wrapper.to_compressed_bytes()
+    assert LegacyAssetDaemonCursorWrapper.from_compressed_bytes(compressed_bytes) == wrapper
+
+
+def test_msgpack_cursor_roundtrip():
+    pytest.importorskip("msgpack")
+    cursor = _populated_cursor()
+
+    serialized = cursor.serialize_v2()
+    assert AssetDaemonCursor.from_serialized(serialized, AssetGraph.from_assets([])) == cursor
+    assert AssetDaemonCursor.get_evaluation_id_from_serialized(serialized) == 12
+
+
+@pytest.mark.parametrize("prefix", [b"", b" \n"], ids=["no_whitespace", "leading_whitespace"])
+def test_json_cursor_as_bytes(prefix):
+    cursor = _populated_cursor()
+
+    serialized = prefix + cursor.serialize().encode("utf-8")
+    assert AssetDaemonCursor.from_serialized(serialized, AssetGraph.from_assets([])) == cursor
+    assert AssetDaemonCursor.get_evaluation_id_from_serialized(serialized) == 12
+
+
+def test_asset_keys_parsed_from_cursors_are_not_shared():
+    serialized = _populated_cursor().serialize()
+    first = AssetDaemonCursor.from_serialized(serialized, AssetGraph.from_assets([]))
+    second = AssetDaemonCursor.from_serialized(serialized, AssetGraph.from_assets([]))
+
+    (first_key,) = first.last_observe_request_timestamp_by_asset_key
+    (second_key,) = second.last_observe_request_timestamp_by_asset_key
+    assert first_key == second_key == AssetKey("source")
+
+    # mutating a key returned for one cursor doesn't affect keys parsed later
+    first_key.path.append("mutated")
+    assert AssetDaemonCursor.from_serialized(serialized, AssetGraph.from_assets([])) == second
+    assert second_key == AssetKey("source")
+
+
+def test_zstd_compressed_cursor_spanning_many_chunks(monkeypatch):
+    pytest.importorskip("zstandard")
+    monkeypatch.setenv("DAGSTER_ASSET_DAEMON_ZSTD_CURSORS", "1")
+    monkeypatch.setattr(asset_daemon_cursor_module, "_COMPRESSION_CHUNK_SIZE", 7)
+    cursor = dataclasses.replace(
+        _populated_cursor(),
+        handled_root_asset_keys=frozenset(AssetKey(f"asset_é_{i}") for i in range(100)),
+    )
+    wrapper = LegacyAssetDaemonCursorWrapper(serialized_cursor=cursor.serialize())
+
+    compressed_bytes = wrapper.to_compressed_bytes()
+    assert LegacyAssetDaemonCursorWrapper.from_compressed_bytes(compressed_bytes) == wrapper
+
+    truncated_bytes = compressed_bytes[: len(compressed_bytes) // 2]
+    with pytest.raises(CheckError, match="truncated"):
+        LegacyAssetDaemonCursorWrapper.from_compressed_bytes(truncated_bytes)
@@ -0,0 +1,97 @@
+import json
+import logging
+import os
+
+import dagster._utils.log as log_module
+import pytest
+from dagster import AssetKey
+from dagster._utils.log import JsonFileHandler
+
+
+def _make_logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.Logger("json_file_handler_test", level=logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def _read_lines(path: str):
+    with open(path, encoding="utf8") as f:
+        return f.read().splitlines()
+
+
+def test_json_file_handler_writes_each_record_immediately(tmpdir):
+    json_path = os.path.join(str(tmpdir), "log.jsonl")
+    handler = JsonFileHandler(json_path)
+    try:
+        logger = _make_logger(handler)
+        for i in range(3):
+            logger.info("message %s", i, extra={"dagster_meta": {"index": i}})
+            # every record must reach the file without the handler being flushed or closed
+            lines = _read_lines(json_path)
+            assert len(lines) == i + 1
+            assert json.loads(lines[-1])["index"] == i
+    finally:
+        handler.close()
+
+    # closing the handler leaves every record in place
+    assert len(_read_lines(json_path)) == 3
+
+
+def test_json_file_handler_reopens_moved_or_deleted_file(tmpdir):
+    json_path = os.path.join(str(tmpdir), "log.jsonl")
+    rotated_path = os.path.join(str(tmpdir), "log.jsonl.1")
+    handler = JsonFileHandler(json_path)
+    try:
+        logger = _make_logger(handler)
+        logger.info("first", extra={"dagster_meta": {"index": 0}})
+        os.rename(json_path, rotated_path)
+        logger.info("second", extra={"dagster_meta": {"index": 1}})
+        os.remove(json_path)
+        logger.info("third", extra={"dagster_meta": {"index": 2}})
+    finally:
+        handler.close()
+
+    assert [json.loads(line)["index"] for line in _read_lines(rotated_path)] == [0]
+    assert [json.loads(line)["index"] for line in _read_lines(json_path)] == [2]
+
+
+def _log_single_record(json_path: str, dagster_meta) -> str:
+    handler = JsonFileHandler(json_path)
+    try:
+        _make_logger(handler).info("message", extra={"dagster_meta": dagster_meta})
+    finally:
+        handler.close()
+    (line,) = _read_lines(json_path)
+    return line
+
+
+def _without_timing_fields(line: str):
+    # LogRecord timing fields differ between any two records
+    log_dict = json.loads(line)
+    for key in ["created", "msecs", "relativeCreated"]:
+        del log_dict[key]
+    return log_dict
+
+
+def test_json_file_handler_orjson_output_matches_stdlib(tmpdir, monkeypatch):
+    pytest.importorskip("orjson")
+    dagster_meta = {
+        "asset_key": AssetKey(["a", "b"]),
+        "nested": {"keys": [AssetKey("c")], "pair": (1, 2)},
+        "label": "h\u00e9",
+    }
+
+    orjson_line = _log_single_record(os.path.join(str(tmpdir), "orjson.jsonl"), dagster_meta)
+    monkeypatch.setattr(log_module, "orjson", None)
+    stdlib_line = _log_single_record(os.path.join(str(tmpdir), "stdlib.jsonl"), dagster_meta)
+
+    assert _without_timing_fields(orjson_line) == _without_timing_fields(stdlib_line)
+    assert json.loads(orjson_line)["asset_key"] == [["a", "b"]]
+
+
+def test_json_file_handler_writes_non_finite_floats_as_null_with_orjson(tmpdir):
+    pytest.importorskip("orjson")
+    line = _log_single_record(
+        os.path.join(str(tmpdir), "log.jsonl"), {"not_a_number": float("nan")}
+    )
+    assert json.loads(line)["not_a_number"] is None
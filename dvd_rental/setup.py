@@ -3,7 +3,7 @@ from setuptools import find_packages, setup
 setup(
     name="dvd_rental",
     version="0.0.1",
-    packages=find_packages(),
+    packages=find_packages(exclude=["dvd_rental_tests"]),
     install_requires=[
         "dagster",
         "dagster-cloud",